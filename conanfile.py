@@ -1,18 +1,22 @@
 from conan import ConanFile
 from conan.tools.cmake import cmake_layout
 
-# from boost recipe from conan-center-index
+# from boost recipe from conan-center-index.
+# the commented-out entries must stay enabled: the code links asio, json,
+# process, system, and program_options (madbfs-msg) directly, and the recipe
+# pulls in container (for json), filesystem (for process), and atomic (for
+# filesystem) as dependencies.
 CONFIGURE_OPTIONS = (
     # "atomic",
     "charconv",
     "chrono",
     "cobalt",
     # "container",
-    # "context",
+    "context",
     "contract",
     "coroutine",
-    # "date_time",
-    # "exception",
+    "date_time",
+    "exception",
     "fiber",
     # "filesystem",
     "graph",
@@ -57,7 +61,7 @@ class Recipe(ConanFile):
         "boost/1.89.0",
         "libfuse/3.18.2",
         "rapidhash/3.0",
-        "spdlog/1.17.0",
+        "spdlog/1.17.0",  # keep in sync with madbfs-server/conanfile.py
         "zstr/1.0.7",
     ]
 
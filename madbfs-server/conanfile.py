@@ -12,7 +12,7 @@ class Recipe(ConanFile):
 
     requires = [
         "asio/1.36.0",  # asio/1.38.0 has a bug in its std::aligned_alloc detection
-        "spdlog/1.17.0",
+        "spdlog/1.17.0",  # keep in sync with the top-level conanfile.py
     ]
 
     def layout(self):